@@ -64,6 +64,11 @@ except ImportError:
 
 # -----------------------------------------------------------------------------
 
+# building an SSL context parses the whole CA bundle, instances with the shareSslContext option reuse one per CA settings
+_ssl_contexts = {}
+
+# -----------------------------------------------------------------------------
+
 
 class Exchange(BaseExchange):
     synchronous = False
@@ -124,12 +129,24 @@ class Exchange(BaseExchange):
             self.throttler.loop = self.asyncio_loop
 
         if self.ssl_context is None:
-            # Create our SSL context object with our CA cert file
-            self.ssl_context = ssl.create_default_context(cafile=self.cafile) if self.verify else self.verify
-            if (self.ssl_context and self.safe_bool(self.options, 'include_OS_certificates', False)):
-                os_default_paths = ssl.get_default_verify_paths()
-                if os_default_paths.cafile and os_default_paths.cafile != self.cafile:
-                    self.ssl_context.load_verify_locations(cafile=os_default_paths.cafile)
+            if self.verify:
+                include_os_certificates = self.safe_bool(self.options, 'include_OS_certificates', False)
+                ssl_context_key = (self.cafile, include_os_certificates)
+                # a shared context is the same object for every instance, it must not be modified per instance
+                share_ssl_context = self.safe_bool(self.options, 'shareSslContext', False)
+                if share_ssl_context and ssl_context_key in _ssl_contexts:
+                    self.ssl_context = _ssl_contexts[ssl_context_key]
+                else:
+                    # Create our SSL context object with our CA cert file
+                    self.ssl_context = ssl.create_default_context(cafile=self.cafile)
+                    if include_os_certificates:
+                        os_default_paths = ssl.get_default_verify_paths()
+                        if os_default_paths.cafile and os_default_paths.cafile != self.cafile:
+                            self.ssl_context.load_verify_locations(cafile=os_default_paths.cafile)
+                    if share_ssl_context:
+                        _ssl_contexts[ssl_context_key] = self.ssl_context
+            else:
+                self.ssl_context = self.verify
 
         if self.own_session and self.session is None:
             # Pass this SSL context to aiohttp and create a TCPConnector
@@ -256,6 +273,13 @@ class Exchange(BaseExchange):
                 http_status_text = response.reason
                 http_response = self.on_rest_response(http_status_code, http_status_text, url, method, headers, http_response, request_headers, request_body)
                 json_response = self.parse_json(http_response)
+                if self.enableRateLimit and self.throttler is not None:
+                    # seconds, the HTTP-date form of the header is ignored
+                    retry_after = self.safe_float_2(headers, 'Retry-After', 'retry-after')
+                    if retry_after is not None:
+                        # capped and non-finite values are ignored by pause(), a bogus header must not stall every later request on this instance
+                        max_retry_after_delay = self.safe_number(self.options, 'maxRetryAfterDelay', 60000)  # milliseconds
+                        self.throttler.pause(min(retry_after * 1000, max_retry_after_delay))
                 if self.enableLastHttpResponse:
                     self.last_http_response = http_response
                 if self.enableLastResponseHeaders:
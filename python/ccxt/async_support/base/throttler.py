@@ -1,6 +1,7 @@
 import asyncio
 import collections
-from time import time
+import math
+from time import monotonic_ns
 
 
 class Throttler:
@@ -8,7 +9,7 @@ class Throttler:
         self.loop = loop
         self.config = {
             'refillRate': 1.0,              # leaky bucket refill rate in tokens per second
-            'delay': 0.001,                 # leaky bucket seconds before checking the queue after waiting
+            'delay': 0.001,                 # leaky bucket minimum seconds to wait before checking the queue again
             'capacity': 1.0,                # leaky bucket
             'tokens': 0,                    # leaky bucket
             'cost': 1.0,                    # leaky bucket and rolling window
@@ -17,72 +18,122 @@ class Throttler:
             'maxWeight': 0.0,                 # rolling window - rollingWindowSize / rateLimit   // ms_of_window / ms_of_rate_limit
         }
         self.config.update(config)
-        if self.config['algorithm'] != 'leakyBucket':
+        # resolved once, the algorithm is checked on every call
+        self.leaky_bucket = self.config['algorithm'] == 'leakyBucket'
+        refill_rate = self.config['refillRate']
+        self.refill_interval = 1 / refill_rate if refill_rate > 0 else 0  # leaky bucket - milliseconds per token
+        if not self.leaky_bucket:
             self.config['maxWeight'] = self.config['windowSize'] / self.config['rateLimit']
         self.queue = collections.deque()
         self.running = False
-        self.timestamps = []
+        self.last_timestamp = monotonic_ns()  # leaky bucket - last refill, monotonic clock in nanoseconds
+        self.timestamps = collections.deque()  # rolling window - (timestamp, cost) pairs, oldest first
+        self.timestamps_weight = 0  # rolling window - sum of the costs in self.timestamps
 
-    async def leaky_bucket_loop(self):
-        last_timestamp = time() * 1000
-        while self.running:
-            future, cost = self.queue[0]
-            cost = self.config['cost'] if cost is None else cost
-            if self.config['tokens'] >= 0:
-                self.config['tokens'] -= cost
-                if not future.done():
-                    future.set_result(None)
-                self.queue.popleft()
-                # context switch
-                await asyncio.sleep(0)
-                if len(self.queue) == 0:
-                    self.running = False
-            else:
-                await asyncio.sleep(self.config['delay'])
-                now = time() * 1000
-                elapsed = now - last_timestamp
-                last_timestamp = now
-                self.config['tokens'] = min(self.config['tokens'] + elapsed * self.config['refillRate'], self.config['capacity'])
+    def leaky_bucket_refill(self):
+        now = monotonic_ns()
+        elapsed = (now - self.last_timestamp) / 1000000  # milliseconds
+        self.last_timestamp = now
+        tokens = self.config['tokens']
+        # an idle bucket only pays back its deficit, otherwise the time spent idle would let a burst through
+        limit = self.config['capacity'] if self.running else max(tokens, 0)
+        self.config['tokens'] = min(tokens + elapsed * self.config['refillRate'], limit)
+        return self.config['tokens']
 
-    async def rolling_window_loop(self):
-        while self.running:
-            future, cost = self.queue[0]
-            cost = self.config['cost'] if cost is None else cost
-            now = time() * 1000
-            cutoffTime = now - self.config['windowSize']
-            totalCost = 0
-            # Remove expired timestamps & sum the remaining requests
-            timestamps = []
-            for t in self.timestamps:
-                if t['timestamp'] > cutoffTime:
-                    totalCost += t['cost']
-                    timestamps.append(t)
-            self.timestamps = timestamps
-            # handle current request
-            if totalCost + cost <= self.config['maxWeight']:
-                self.timestamps.append({'timestamp': now, 'cost': cost})
-                if not future.done():
-                    future.set_result(None)
-                self.queue.popleft()
-                # context switch
-                await asyncio.sleep(0)
-                if not self.queue:
-                    self.running = False
-            else:
-                wait_time = (self.timestamps[0]['timestamp'] + self.config['windowSize']) - now
-                if wait_time > 0:
-                    await asyncio.sleep(wait_time / 1000)
+    def leaky_bucket_tick(self, loop):
+        config = self.config
+        queue = self.queue
+        default_cost = config['cost']
+        tokens = self.leaky_bucket_refill()
+        # release every request the bucket can take
+        while queue and tokens >= 0:
+            future, cost = queue.popleft()
+            tokens -= default_cost if cost is None else cost
+            if not future.done():
+                future.set_result(None)
+        config['tokens'] = tokens
+        if not queue:
+            self.running = False
+            return
+        # wake up when the bucket is refilled instead of polling every delay
+        wait_time = -tokens * self.refill_interval
+        loop.call_later(max(wait_time / 1000, config['delay']), self.leaky_bucket_tick, loop)
+
+    def rolling_window_expire(self, now):
+        # Remove expired timestamps (oldest first) & subtract them from the window total
+        timestamps = self.timestamps
+        weight = self.timestamps_weight
+        cutoff_time = now - self.config['windowSize'] * 1000000
+        while timestamps and timestamps[0][0] <= cutoff_time:
+            weight -= timestamps.popleft()[1]
+        if not timestamps:
+            weight = 0  # drop accumulated float error
+        self.timestamps_weight = weight
+        return weight
 
-    async def looper(self):
-        if self.config['algorithm'] == 'leakyBucket':
-            await self.leaky_bucket_loop()
+    def rolling_window_tick(self, loop):
+        config = self.config
+        queue = self.queue
+        timestamps = self.timestamps
+        default_cost = config['cost']
+        max_weight = config['maxWeight']
+        now = monotonic_ns()
+        window_size = config['windowSize'] * 1000000  # nanoseconds
+        weight = self.rolling_window_expire(now)
+        # handle every queued request that still fits in the window
+        while queue:
+            future, cost = queue[0]
+            cost = default_cost if cost is None else cost
+            if weight + cost > max_weight:
+                break
+            timestamps.append((now, cost))
+            weight += cost
+            if not future.done():
+                future.set_result(None)
+            queue.popleft()
+        self.timestamps_weight = weight
+        if not queue:
+            self.running = False
+            return
+        # wake up when the oldest request leaves the window
+        wait_time = (timestamps[0][0] + window_size) - now
+        loop.call_later(max(wait_time / 1000000000, 0), self.rolling_window_tick, loop)
+
+    def pause(self, milliseconds):
+        # hold back every queued and upcoming request for the given time, e.g. after a Retry-After response header
+        if not (milliseconds > 0) or not math.isfinite(milliseconds):  # also rejects nan, which would never expire
+            return
+        if self.leaky_bucket:
+            self.config['tokens'] = min(self.leaky_bucket_refill(), -milliseconds * self.config['refillRate'])
         else:
-            await self.rolling_window_loop()
+            # a full-weight entry that expires when the pause is over, older entries expire before it anyway
+            resume_timestamp = monotonic_ns() + milliseconds * 1000000 - self.config['windowSize'] * 1000000
+            while self.timestamps and self.timestamps[0][0] <= resume_timestamp:
+                self.timestamps_weight -= self.timestamps.popleft()[1]
+            self.timestamps.appendleft((resume_timestamp, self.config['maxWeight']))
+            self.timestamps_weight += self.config['maxWeight']
 
     def __call__(self, cost=None):
-        future = asyncio.Future()
+        loop = self.loop if self.loop is not None else asyncio.get_event_loop()
+        future = loop.create_future()
+        if not self.running:
+            # idle throttler with room to spare, no need to go through the queue
+            if self.leaky_bucket:
+                if self.leaky_bucket_refill() >= 0:
+                    self.config['tokens'] -= self.config['cost'] if cost is None else cost
+                    future.set_result(None)
+                    return future
+            else:
+                now = monotonic_ns()
+                weight = self.rolling_window_expire(now)
+                request_cost = self.config['cost'] if cost is None else cost
+                if weight + request_cost <= self.config['maxWeight']:
+                    self.timestamps.append((now, request_cost))
+                    self.timestamps_weight = weight + request_cost
+                    future.set_result(None)
+                    return future
         self.queue.append((future, cost))
         if not self.running:
             self.running = True
-            asyncio.ensure_future(self.looper(), loop=self.loop)
+            loop.call_soon(self.leaky_bucket_tick if self.leaky_bucket else self.rolling_window_tick, loop)
         return future
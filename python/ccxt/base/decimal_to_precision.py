@@ -32,6 +32,8 @@ TICK_SIZE = 4
 NO_PADDING = 5
 PAD_WITH_ZERO = 6
 
+_TRAILING_ZEROS_REGEX = re.compile(r'0+$')
+
 
 def decimal_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
     assert precision is not None, 'precision should not be None'
@@ -96,11 +98,11 @@ def decimal_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=D
                     dec = dec + missing
                 else:
                     dec = dec - missing
-        parts = re.sub(r'0+$', '', '{:f}'.format(precision_dec)).split('.')
+        parts = _TRAILING_ZEROS_REGEX.sub('', '{:f}'.format(precision_dec)).split('.')
         if len(parts) > 1:
             new_precision = len(parts[1])
         else:
-            match = re.search(r'0+$', parts[0])
+            match = _TRAILING_ZEROS_REGEX.search(parts[0])
             if match is None:
                 new_precision = 0
             else:
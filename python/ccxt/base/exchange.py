@@ -145,6 +145,7 @@ from requests.exceptions import HTTPError, Timeout, TooManyRedirects, RequestExc
 # import socket
 from ssl import SSLError
 # import sys
+import threading
 import time
 import uuid
 import zlib
@@ -164,6 +165,10 @@ class SafeJSONEncoder(json.JSONEncoder):
         except TypeError:
             return f"TypeError: Object of type {type(obj).__name__} is not JSON serializable"
 
+
+# json.dumps(cls=...) builds a new encoder on every call, this one is shared instead
+safe_json_encoder = SafeJSONEncoder(separators=(',', ':'))
+
 class Exchange(object):
     """Base exchange class"""
     id = None
@@ -455,27 +460,64 @@ class Exchange(object):
 
         # convert all properties from underscore notation foo_bar to camelcase notation fooBar
         cls = type(self)
-        for name in dir(self):
-            if name[0] != '_' and name[-1] != '_' and '_' in name:
-                parts = name.split('_')
-                # fetch_ohlcv → fetchOHLCV (not fetchOhlcv!)
-                exceptions = {'ohlcv': 'OHLCV', 'le': 'LE', 'be': 'BE', 'adl': 'ADL'}
-                camelcase = parts[0] + ''.join(exceptions.get(i, self.capitalize(i)) for i in parts[1:])
-                attr = getattr(self, name)
+        if '_camelcase_properties' not in cls.__dict__:
+            # the candidate names are the same for every instance, so they are collected once per class
+            # walk the class dicts directly instead of dir(), which sorts every name
+            names = set()
+            for klass in cls.__mro__:
+                names.update(name for name in klass.__dict__ if name[0] != '_' and name[-1] != '_' and '_' in name)
+            methods = {}
+            properties = []
+            for name in sorted(names):
+                camelcase = self._underscore_to_camelcase(name)
+                if name in self.__dict__:
+                    # shadowed by the constructor config, classify by what the class defines
+                    value = next(klass.__dict__[name] for klass in cls.__mro__ if name in klass.__dict__)
+                    attr = value.__get__(self, cls) if hasattr(value, '__get__') else value
+                else:
+                    attr = getattr(self, name)
                 if isinstance(attr, types.MethodType):
-                    setattr(cls, camelcase, getattr(cls, name))
+                    methods[name] = camelcase
                 else:
-                    if hasattr(self, camelcase):
-                        if attr is not None:
-                            setattr(self, camelcase, attr)
-                    else:
-                        setattr(self, camelcase, attr)
+                    properties.append((name, camelcase))
+            cls._camelcase_methods = methods
+            cls._camelcase_properties = properties
+        methods = cls._camelcase_methods
+        # re-aliased on every instance, so methods replaced on the class (e.g. mocks) are picked up by their camelcase names
+        for name, camelcase in methods.items():
+            setattr(cls, camelcase, getattr(cls, name))
+        for name, camelcase in cls._camelcase_properties:
+            self._set_camelcase_property(name, camelcase)
+        # instance-only attributes, e.g. from the constructor config
+        for name in list(self.__dict__):
+            if name in methods:
+                # a method overridden through the constructor config
+                if not isinstance(self.__dict__[name], types.MethodType):
+                    self._set_camelcase_property(name, methods[name])
+            elif name[0] != '_' and name[-1] != '_' and '_' in name and not hasattr(cls, name):
+                self._set_camelcase_property(name, self._underscore_to_camelcase(name))
 
         if not self.session and self.synchronous:
             self.session = Session()
             self.session.trust_env = self.requests_trust_env
         self.logger = self.logger if self.logger else logging.getLogger(__name__)
 
+    # fetch_ohlcv → fetchOHLCV (not fetchOhlcv!)
+    _CAMELCASE_EXCEPTIONS = {'ohlcv': 'OHLCV', 'le': 'LE', 'be': 'BE', 'adl': 'ADL'}
+
+    def _underscore_to_camelcase(self, name):
+        parts = name.split('_')
+        exceptions = self._CAMELCASE_EXCEPTIONS
+        return parts[0] + ''.join(exceptions[i] if i in exceptions else self.capitalize(i) for i in parts[1:])
+
+    def _set_camelcase_property(self, name, camelcase):
+        attr = getattr(self, name)
+        if hasattr(self, camelcase):
+            if attr is not None:
+                setattr(self, camelcase, attr)
+        else:
+            setattr(self, camelcase, attr)
+
     def __del__(self):
         if self.session:
             try:
@@ -493,14 +535,18 @@ class Exchange(object):
         # stub in sync
         pass
 
+    # only guards the slot reservation below, threads sleep until their slot without holding it
+    _throttle_lock = threading.Lock()
+    _throttle_timestamp = 0  # when the last reserved request may go out, monotonic clock in nanoseconds
+
     def throttle(self, cost=None):
-        now = float(self.milliseconds())
-        elapsed = now - self.lastRestRequestTimestamp
         cost = 1 if cost is None else cost
-        sleep_time = self.rateLimit * cost
-        if elapsed < sleep_time:
-            delay = sleep_time - elapsed
-            time.sleep(delay / 1000.0)
+        with self._throttle_lock:
+            now = time.monotonic_ns()
+            timestamp = max(now, self._throttle_timestamp + self.rateLimit * cost * 1000000)
+            self._throttle_timestamp = timestamp
+        if timestamp > now:
+            time.sleep((timestamp - now) / 1000000000)
 
     def read_file(self, path: str, encoding: str = 'utf-8'):
         """
@@ -540,7 +586,6 @@ class Exchange(object):
         """
         self._ensure_whitelisted_file(path)
         try:
-            import os
             return os.path.isfile(path)
         except Exception:
             return False
@@ -573,10 +618,10 @@ class Exchange(object):
         userAgent = self.userAgent if self.userAgent is not None else self.user_agent
         if userAgent:
             if type(userAgent) is str:
-                headers.update({'User-Agent': userAgent})
+                headers['User-Agent'] = userAgent
             elif (type(userAgent) is dict) and ('User-Agent' in userAgent):
                 headers.update(userAgent)
-        headers.update({'Accept-Encoding': 'gzip, deflate'})
+        headers['Accept-Encoding'] = 'gzip, deflate'
         return self.set_headers(headers)
 
     def log(self, *args):
@@ -1187,11 +1232,14 @@ class Exchange(object):
 
     @staticmethod
     def extract_params(string):
+        if '{' not in string:
+            return []
         return Exchange.extract_params_regex.findall(string)
 
     @staticmethod
     def implode_params(string, params):
-        if isinstance(params, dict):
+        # most paths have no placeholders, skip the scan over every param for them
+        if isinstance(params, dict) and '{' in string:
             for key in params:
                 if not isinstance(params[key], list):
                     string = string.replace('{' + key + '}', str(params[key]))
@@ -1209,30 +1257,24 @@ class Exchange(object):
 
     @staticmethod
     def urlencode_with_array_repeat(params={}):
-        return Exchange._URLENCODE_WITH_ARRAY_REPEAT_REGEX.sub('', Exchange.urlencode(params, True))
+        result = Exchange.urlencode(params, True)
+        # only keys with brackets need the regex pass
+        return Exchange._URLENCODE_WITH_ARRAY_REPEAT_REGEX.sub('', result) if '%5B' in result else result
 
     @staticmethod
     def urlencode_nested(params):
         result = {}
-
-        def _encode_params(params, p_key=None):
-            encode_params = {}
-            if isinstance(params, dict):
-                for key in params:
-                    encode_key = '{}[{}]'.format(p_key, key)
-                    encode_params[encode_key] = params[key]
-            elif isinstance(params, (list, tuple)):
-                for offset, value in enumerate(params):
-                    encode_key = '{}[{}]'.format(p_key, offset)
-                    encode_params[encode_key] = value
-            else:
-                result[p_key] = params
-            for key in encode_params:
-                value = encode_params[key]
-                _encode_params(value, key)
         if isinstance(params, dict):
-            for key in params:
-                _encode_params(params[key], key)
+            # depth-first walk with an explicit stack, children pushed in reverse to keep their order
+            stack = [(key, params[key]) for key in reversed(list(params))]
+            while stack:
+                key, value = stack.pop()
+                if isinstance(value, dict):
+                    stack.extend(('{}[{}]'.format(key, k), value[k]) for k in reversed(list(value)))
+                elif isinstance(value, (list, tuple)):
+                    stack.extend(('{}[{}]'.format(key, offset), value[offset]) for offset in reversed(range(len(value))))
+                else:
+                    result[key] = value
         return _urlencode.urlencode(result, safe='[]', quote_via=_urlencode.quote)
 
     @staticmethod
@@ -1733,7 +1775,7 @@ class Exchange(object):
     def json(data, params=None):
         if orjson:
             return orjson.dumps(data).decode('utf-8')
-        return json.dumps(data, separators=(',', ':'), cls=SafeJSONEncoder)
+        return safe_json_encoder.encode(data)
 
     @staticmethod
     def is_json_encoded_object(input):
@@ -2051,8 +2093,10 @@ class Exchange(object):
         length = min(100000, len(message))
         return message[0:length]
 
+    _UN_CAMEL_CASE_REGEX = re.compile('(?!^)([A-Z]+)')
+
     def un_camel_case(self, str):
-        return re.sub('(?!^)([A-Z]+)', r'_\1', str).lower()
+        return self._UN_CAMEL_CASE_REGEX.sub(r'_\1', str).lower()
 
     def fix_stringified_json_members(self, content):
         # when stringified json has members with their values also stringified, like:
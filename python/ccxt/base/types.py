@@ -31,16 +31,15 @@ class Entry:
         self.method = method
         self.config = config
 
-        def unbound_method(_self, params={}):
-            return _self.request(self.path, self.api, self.method, params, config=self.config)
-
-        self.unbound_method = unbound_method
+    # the entry itself is the unbound method, so no closure has to be created per endpoint
+    def __call__(self, _self, params={}):
+        return _self.request(self.path, self.api, self.method, params, config=self.config)
 
     def __get__(self, instance, owner):
         if instance is None:
-            return self.unbound_method
+            return self
         else:
-            return types.MethodType(self.unbound_method, instance)
+            return types.MethodType(self, instance)
 
     def __set_name__(self, owner, name):
         self.name = name
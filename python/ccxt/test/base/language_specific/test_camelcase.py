@@ -0,0 +1,44 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import ccxt  # noqa: F402
+
+
+def fetch_ticker_override(symbol, params={}):
+    return {'symbol': symbol}
+
+
+def test_camelcase_config_override():
+    # the camelcase names are resolved once per class, so the overriding instance is checked both first and second
+    class OverriddenFirst(ccxt.kraken):
+        pass
+
+    class OverriddenSecond(ccxt.kraken):
+        pass
+
+    overridden_first = OverriddenFirst({'fetch_ticker': fetch_ticker_override})
+    default_first = OverriddenFirst()
+    default_second = OverriddenSecond()
+    overridden_second = OverriddenSecond({'fetch_ticker': fetch_ticker_override})
+
+    assert overridden_first.fetchTicker is fetch_ticker_override, 'fetchTicker should be the method passed to the first instance'
+    assert overridden_second.fetchTicker is fetch_ticker_override, 'fetchTicker should be the method passed to a later instance'
+    assert default_first.fetchTicker.__func__ is ccxt.kraken.fetch_ticker, 'an instance without the override should keep the class method'
+    assert default_second.fetchTicker.__func__ is ccxt.kraken.fetch_ticker, 'an instance without the override should keep the class method'
+
+
+def test_camelcase_class_override():
+    class Mocked(ccxt.kraken):
+        pass
+
+    Mocked()
+    Mocked.fetch_ticker = lambda self, symbol, params={}: {'symbol': symbol}
+    assert Mocked().fetchTicker('BTC/USD') == {'symbol': 'BTC/USD'}, 'fetchTicker should follow a fetch_ticker replaced on the class'
+
+
+def test_camelcase():
+    test_camelcase_config_override()
+    test_camelcase_class_override()
@@ -14,9 +14,13 @@ sys.path.append(root)
 
 
 from ccxt.test.base.test_deep_extend import test_deep_extend # noqa E402
+from ccxt.test.base.language_specific.test_camelcase import test_camelcase  # noqa E402
+from ccxt.test.base.language_specific.test_throttle_sync_threads import test_throttle_sync_threads  # noqa E402
 from ccxt.test.base.language_specific.test_throttler_performance import test_throttler_performance  # noqa E402
 
 
 
 async def test_language_specific():
+    test_camelcase()
+    test_throttle_sync_threads()
     test_throttler_performance()
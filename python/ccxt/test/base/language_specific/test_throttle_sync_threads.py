@@ -0,0 +1,48 @@
+import os
+import sys
+import threading
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import ccxt  # noqa: F402
+
+
+def assert_spacing(release_times, min_gap, message):
+    release_times = sorted(release_times)
+    gaps = [later - earlier for earlier, later in zip(release_times, release_times[1:])]
+    assert min(gaps) >= min_gap, message + ', but the smallest gap was: ' + str(round(min(gaps), 2))
+
+
+def test_throttle_sync_threads():
+    rate_limit = 100
+    tolerance = 10  # milliseconds, for timer granularity
+    exchange = ccxt.binance({
+        'enableRateLimit': True,
+        'rateLimit': rate_limit,
+    })
+
+    # threads sharing one instance must not go out together
+    num_threads = 5
+    release_times = []
+
+    def throttle_call():
+        exchange.throttle(1)
+        release_times.append(time.monotonic() * 1000)
+
+    threads = [threading.Thread(target=throttle_call) for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(release_times) == num_threads
+    assert_spacing(release_times, rate_limit - tolerance, 'Threads sharing an exchange should be spaced by the rateLimit')
+
+    # a single thread with a cost of 2 waits twice the rateLimit between requests
+    time.sleep(2 * rate_limit / 1000)
+    release_times = []
+    for _ in range(3):
+        exchange.throttle(2)
+        release_times.append(time.monotonic() * 1000)
+    assert_spacing(release_times, 2 * rate_limit - tolerance, 'Requests with a cost of 2 should be spaced by twice the rateLimit')
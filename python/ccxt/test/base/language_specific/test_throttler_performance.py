@@ -6,6 +6,7 @@ root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.a
 sys.path.append(root)
 
 import ccxt.async_support as ccxt  # noqa: F402
+from aiohttp import web  # noqa: F402
 
 async def test_throttler_performance_helper(exchange, num_requests):
     start_time = exchange.milliseconds()
@@ -35,6 +36,13 @@ async def throttle_call(exchange, index, start_time):
         print(f"Throttle call {index + 1} failed: {e}")
         raise e
 
+async def retry_after_handler(request):
+    return web.Response(text='{}', content_type='application/json', headers={'Retry-After': request.query['seconds']})
+
+async def test_retry_after_pause_helper(exchange, url, seconds):
+    await exchange.fetch(url + '?seconds=' + seconds)
+    return await test_throttler_performance_helper(exchange, 1)
+
 async def test_throttler():
     exchange1 = ccxt.binance({
         'enableRateLimit': True,
@@ -66,6 +74,83 @@ async def test_throttler():
     finally:
         await exchange3.close()
 
+    paused_exchange = ccxt.binance({
+        'enableRateLimit': True,
+        'rateLimiterAlgorithm': 'leakyBucket',
+    })
+
+    try:
+        await paused_exchange.throttle(1)
+        paused_exchange.throttler.pause(500)  # as after a Retry-After: 0.5 response header
+        paused_time = await test_throttler_performance_helper(paused_exchange, 1)
+    finally:
+        await paused_exchange.close()
+
+    rolling_window_paused_exchange = ccxt.binance({
+        'enableRateLimit': True,
+        'rateLimiterAlgorithm': 'rollingWindow',
+    })
+
+    try:
+        await rolling_window_paused_exchange.throttle(1)
+        rolling_window_paused_exchange.throttler.pause(500)
+        rolling_window_paused_time = await test_throttler_performance_helper(rolling_window_paused_exchange, 1)
+    finally:
+        await rolling_window_paused_exchange.close()
+
+    app = web.Application()
+    app.router.add_get('/', retry_after_handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    url = 'http://127.0.0.1:' + str(runner.addresses[0][1]) + '/'
+    retry_after_exchange = ccxt.binance({
+        'enableRateLimit': True,
+        'rateLimiterAlgorithm': 'leakyBucket',
+        'options': {
+            'maxRetryAfterDelay': 300,
+        },
+    })
+
+    try:
+        retry_after_time = await test_retry_after_pause_helper(retry_after_exchange, url, '0.2')
+        capped_retry_after_time = await test_retry_after_pause_helper(retry_after_exchange, url, '86400')
+    finally:
+        await retry_after_exchange.close()
+
+    rolling_window_retry_after_exchange = ccxt.binance({
+        'enableRateLimit': True,
+        'rateLimiterAlgorithm': 'rollingWindow',
+    })
+
+    try:
+        # a nan pause would never leave the rolling window
+        nan_retry_after_time = await asyncio.wait_for(test_retry_after_pause_helper(rolling_window_retry_after_exchange, url, 'nan'), 5)
+    finally:
+        await rolling_window_retry_after_exchange.close()
+        await runner.cleanup()
+
+    idle_exchange = ccxt.binance({
+        'enableRateLimit': True,
+        'rateLimiterAlgorithm': 'leakyBucket',
+        'rateLimit': 100,
+    })
+
+    try:
+        await idle_exchange.throttle(1)
+        await asyncio.sleep(0.3)  # idle for longer than the rateLimit
+        idle_time = await test_throttler_performance_helper(idle_exchange, 2)
+    finally:
+        await idle_exchange.close()
+
+    assert paused_time >= 450, 'Paused throttler should hold the next request for half a second, but time was: ' + str(round(paused_time, 2))
+    assert rolling_window_paused_time >= 450, 'Paused rolling window throttler should hold the next request for half a second, but time was: ' + str(round(rolling_window_paused_time, 2))
+    assert retry_after_time >= 150, 'A Retry-After response header should hold the next request, but time was: ' + str(round(retry_after_time, 2))
+    assert 250 <= capped_retry_after_time <= 1000, 'A Retry-After response header should hold the next request for at most maxRetryAfterDelay, but time was: ' + str(round(capped_retry_after_time, 2))
+    assert nan_retry_after_time <= 1000, 'A Retry-After: nan response header should be ignored, but time was: ' + str(round(nan_retry_after_time, 2))
+    assert idle_time >= 90, 'An idle leaky bucket should still space two requests by the rateLimit, but time was: ' + str(round(idle_time, 2))
+
     rolling_window_time_string = str(round(rolling_window_time, 2))
     leaky_bucket_time_string = str(round(leaky_bucket_time, 2))
     rolling_window_0_time_string = str(round(rolling_window_0_time, 2))  # uses leakyBucket